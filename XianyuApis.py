@@ -1,5 +1,6 @@
 import json
 import time
+from http.cookiejar import DefaultCookiePolicy
 
 import requests
 
@@ -9,6 +10,11 @@ from utils.xianyu_utils import generate_sign, trans_cookies, generate_device_id
 class XianyuApis:
     def __init__(self):
         self.url = 'https://h5api.m.goofish.com/h5/mtop.taobao.idlemessage.pc.login.token/1.0/'
+        # 复用同一个Session，保持与h5api的长连接，避免每次请求重新握手
+        self.session = requests.Session()
+        # 禁止Session收集响应中的Set-Cookie，每次请求只发送调用方传入的cookies，
+        # 否则服务端轮换的_m_h5_tk会与传入的旧值同时发送，且与sign不一致
+        self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
         self.headers = {
             'accept': 'application/json',
             'accept-language': 'zh-CN,zh;q=0.9',
@@ -48,7 +54,7 @@ class XianyuApis:
         token = cookies['_m_h5_tk'].split('_')[0]
         sign = generate_sign(params['t'], token, data_val)
         params['sign'] = sign
-        response = requests.post('https://h5api.m.goofish.com/h5/mtop.taobao.idlemessage.pc.login.token/1.0/', params=params, cookies=cookies, headers=self.headers, data=data)
+        response = self.session.post('https://h5api.m.goofish.com/h5/mtop.taobao.idlemessage.pc.login.token/1.0/', params=params, cookies=cookies, headers=self.headers, data=data)
         res_json = response.json()
         return res_json
 
@@ -75,6 +81,6 @@ class XianyuApis:
         token = cookies['_m_h5_tk'].split('_')[0]
         sign = generate_sign(params['t'], token, data_val)
         params['sign'] = sign
-        response = requests.post('https://h5api.m.goofish.com/h5/mtop.taobao.idle.pc.detail/1.0/', params=params, cookies=cookies, headers=self.headers, data=data)
+        response = self.session.post('https://h5api.m.goofish.com/h5/mtop.taobao.idle.pc.detail/1.0/', params=params, cookies=cookies, headers=self.headers, data=data)
         res_json = response.json()
         return res_json
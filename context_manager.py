@@ -90,24 +90,20 @@ class ChatContextManager:
                 (user_id, item_id, role, content, datetime.now().isoformat())
             )
             
-            # 检查是否需要清理旧消息
+            # 清理超出保留数量的旧消息（子查询无结果时不会删除任何记录）
             cursor.execute(
                 """
-                SELECT id FROM messages 
-                WHERE user_id = ? AND item_id = ? 
-                ORDER BY timestamp DESC 
-                LIMIT ?, 1
+                DELETE FROM messages 
+                WHERE user_id = ? AND item_id = ? AND id < (
+                    SELECT id FROM messages 
+                    WHERE user_id = ? AND item_id = ? 
+                    ORDER BY timestamp DESC 
+                    LIMIT ?, 1
+                )
                 """, 
-                (user_id, item_id, self.max_history)
+                (user_id, item_id, user_id, item_id, self.max_history)
             )
             
-            oldest_to_keep = cursor.fetchone()
-            if oldest_to_keep:
-                cursor.execute(
-                    "DELETE FROM messages WHERE user_id = ? AND item_id = ? AND id < ?",
-                    (user_id, item_id, oldest_to_keep[0])
-                )
-            
             conn.commit()
         except Exception as e:
             logger.error(f"添加消息到数据库时出错: {e}")
@@ -127,6 +123,7 @@ class ChatContextManager:
         cursor = conn.cursor()
         
         try:
+            now = datetime.now().isoformat()
             # 使用UPSERT语法（SQLite 3.24.0及以上版本支持）
             cursor.execute(
                 """
@@ -135,7 +132,7 @@ class ChatContextManager:
                 ON CONFLICT(user_id, item_id) 
                 DO UPDATE SET count = count + 1, last_updated = ?
                 """,
-                (user_id, item_id, datetime.now().isoformat(), datetime.now().isoformat())
+                (user_id, item_id, now, now)
             )
             
             conn.commit()
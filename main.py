@@ -6,6 +6,13 @@ import os
 import websockets
 from loguru import logger
 from dotenv import load_dotenv
+
+try:
+    # orjson 解析速度远快于标准库json，未安装时回退到json
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 from XianyuApis import XianyuApis
 
 
@@ -24,7 +31,7 @@ class XianyuLive:
         self.device_id = generate_device_id(self.myid)
         self.context_manager = ChatContextManager()
         
-        # 心跳相关配置
+        # 心跳相关配置（心跳时间戳使用time.monotonic()，不受系统时间调整影响）
         self.heartbeat_interval = 15  # 心跳间隔15秒
         self.heartbeat_timeout = 5    # 心跳超时5秒
         self.last_heartbeat_time = 0
@@ -192,13 +199,13 @@ class XianyuLive:
                 data = sync_data["data"]
                 try:
                     data = base64.b64decode(data).decode("utf-8")
-                    data = json.loads(data)
+                    data = json_loads(data)
                     # logger.info(f"无需解密 message: {data}")
                     return
                 except Exception as e:
                     # logger.info(f'加密数据: {data}')
                     decrypted_data = decrypt(data)
-                    message = json.loads(decrypted_data)
+                    message = json_loads(decrypted_data)
             except Exception as e:
                 logger.error(f"消息解密失败: {e}")
                 return
@@ -255,7 +262,11 @@ class XianyuLive:
                 return
                 
             # 获取商品信息并检查itemDO是否存在
-            item_info_response = self.xianyu.get_item_info(self.cookies, item_id)
+            # 同步HTTP请求放到线程池执行，避免阻塞事件循环（心跳等）
+            loop = asyncio.get_running_loop()
+            item_info_response = await loop.run_in_executor(
+                None, self.xianyu.get_item_info, self.cookies, item_id
+            )
             
             # 使用get方法安全地获取嵌套数据
             item_info = item_info_response.get('data', {}).get('itemDO', {})
@@ -279,11 +290,13 @@ class XianyuLive:
             # 获取完整的对话上下文
             context = self.context_manager.get_context(send_user_id, item_id)
             
-            # 生成回复
-            bot_reply = bot.generate_reply(
+            # 生成回复（大模型调用耗时较长，同样放到线程池执行）
+            bot_reply = await loop.run_in_executor(
+                None,
+                bot.generate_reply,
                 send_message,
                 item_description,
-                context=context
+                context
             )
             
             # 检查是否为价格意图，如果是则增加议价次数
@@ -314,7 +327,7 @@ class XianyuLive:
                 }
             }
             await ws.send(json.dumps(heartbeat_msg))
-            self.last_heartbeat_time = time.time()
+            self.last_heartbeat_time = time.monotonic()
             logger.debug("心跳包已发送")
             return heartbeat_mid
         except Exception as e:
@@ -325,7 +338,7 @@ class XianyuLive:
         """心跳维护循环"""
         while True:
             try:
-                current_time = time.time()
+                current_time = time.monotonic()
                 
                 # 检查是否需要发送心跳
                 if current_time - self.last_heartbeat_time >= self.heartbeat_interval:
@@ -335,8 +348,11 @@ class XianyuLive:
                 if (current_time - self.last_heartbeat_response) > (self.heartbeat_interval + self.heartbeat_timeout):
                     logger.warning("心跳响应超时，可能连接已断开")
                     break
-                
-                await asyncio.sleep(1)
+
+                # 直接休眠到下一次发送心跳或响应超时的时间点，避免每秒轮询
+                next_heartbeat = self.last_heartbeat_time + self.heartbeat_interval
+                response_deadline = self.last_heartbeat_response + self.heartbeat_interval + self.heartbeat_timeout
+                await asyncio.sleep(max(min(next_heartbeat, response_deadline) - time.monotonic(), 0))
             except Exception as e:
                 logger.error(f"心跳循环出错: {e}")
                 break
@@ -351,7 +367,7 @@ class XianyuLive:
                 and "code" in message_data
                 and message_data["code"] == 200
             ):
-                self.last_heartbeat_response = time.time()
+                self.last_heartbeat_response = time.monotonic()
                 logger.debug("收到心跳响应")
                 return True
         except Exception as e:
@@ -378,15 +394,15 @@ class XianyuLive:
                     await self.init(websocket)
                     
                     # 初始化心跳时间
-                    self.last_heartbeat_time = time.time()
-                    self.last_heartbeat_response = time.time()
+                    self.last_heartbeat_time = time.monotonic()
+                    self.last_heartbeat_response = time.monotonic()
                     
                     # 启动心跳任务
                     self.heartbeat_task = asyncio.create_task(self.heartbeat_loop(websocket))
                     
                     async for message in websocket:
                         try:
-                            message_data = json.loads(message)
+                            message_data = json_loads(message)
                             
                             # 处理心跳响应
                             if await self.handle_heartbeat_response(message_data):
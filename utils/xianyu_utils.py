@@ -12,10 +12,9 @@ except:
 def trans_cookies(cookies_str):
     cookies = dict()
     for i in cookies_str.split("; "):
-        try:
-            cookies[i.split('=')[0]] = '='.join(i.split('=')[1:])
-        except:
-            continue
+        # 只按第一个'='切分，值中可能包含'='（如base64数据）
+        name, _, value = i.partition('=')
+        cookies[name] = value
     return cookies
 
 